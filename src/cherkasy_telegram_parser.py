@@ -3,17 +3,39 @@
 # Parser for Cherkasy Oblenergo (Telegram)
 
 import asyncio
+import atexit
+import math
 import re
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
-from playwright.async_api import async_playwright
+import argparse
 import os
 
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import orjson
+except ImportError:  # необов'язкова залежність — працюємо через stdlib json
+    orjson = None
+
+try:
+    import lxml  # noqa: F401 — лише перевіряємо, чи доступний C-парсер для bs4
+    HTML_PARSER = "lxml"
+except ImportError:  # необов'язкова залежність — повільніший html.parser зі stdlib
+    HTML_PARSER = "html.parser"
+
 # ================== НАЛАШТУВАННЯ ==================
 
 TZ = ZoneInfo("Europe/Kyiv")
+UTC = ZoneInfo("UTC")
 URL = "https://t.me/s/pat_cherkasyoblenergo"
+HTTP_TIMEOUT = 30
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+}
 OUTPUT_FILE = "out/Cherkasyoblenergo.json"
 
 LOG_DIR = "logs"
@@ -22,46 +44,101 @@ FULL_LOG_FILE = os.path.join(LOG_DIR, "full_log.log")
 os.makedirs(LOG_DIR, exist_ok=True)
 os.makedirs("out", exist_ok=True)
 
+# Порядок важливий лише для швидкості: any() зупиняється на першому збігу,
+# тому найчастіші в постах з графіками фрази стоять першими
 KEYWORDS = [
+    "ГПВ",
+    "години відсутності електропостачання",
     "графіки погодинних відключень",
-    "графіки погодинних вимкнень",
     "графік погодинних відключень",
+    "графіки погодинних вимкнень",
     "графік погодинних вимкнень",
-    "ГПВ",
-    "години відсутності електропостачання",
     "застосовуватимуться графіки",
     "оновлений графік"
 ]
 
+KEYWORDS_LC = tuple(k.lower() for k in KEYWORDS)
+
+UPDATE_KEYWORDS = (
+    "оновлений графік",
+    "оновлено графік",
+    "скорегований графік"
+)
+
+# Заголовок блоку з інтервалами — без нього пост не містить графіка
+SCHEDULE_HEADER = "Години відсутності електропостачання"
+
+MONTHS = {
+    'січня': '01', 'лютого': '02', 'березня': '03', 'квітня': '04',
+    'травня': '05', 'червня': '06', 'липня': '07', 'серпня': '08',
+    'вересня': '09', 'жовтня': '10', 'листопада': '11', 'грудня': '12'
+}
+
+# Регулярні вирази компілюються один раз при імпорті модуля
+MONTHS_RE = re.compile(r'(\d{1,2})\s+(' + "|".join(MONTHS) + ')')
+# Двокрапка або пробіл після номера групи: "1.1 08:00-10:00" / "1.1: 08:00-10:00"
+LINE_RE = re.compile(r'(\d)\.(\d)[:\s]*\s*(.+)')
+# Групи 1 і 4 — час "HH:MM" цілком (для логу), 2/3 і 5/6 — години та хвилини
+INTERVAL_RE = re.compile(r'((\d{1,2}):(\d{2}))\s*[-–—]\s*((\d{1,2}):(\d{2}))')
+
 # ================== ЛОГУВАННЯ ==================
 
+# Файл логу відкривається один раз, при першому записі, і закривається при
+# виході. Буферизація по рядках: у full_log.log пишуть і інші модулі
+# (main, telegram_notify), тож кожен рядок має потрапити у файл одразу
+_log_file = None
+
+
+def _get_log_file():
+    global _log_file
+    if _log_file is None:
+        _log_file = open(FULL_LOG_FILE, "a", encoding="utf-8", buffering=1)
+        atexit.register(_log_file.close)
+    return _log_file
+
+
 def log(message: str):
     ts = datetime.now(TZ).strftime("%Y-%m-%d %H:%M:%S")
     line = f"{ts} [cherkasy_parser] {message}"
     print(line)
-    with open(FULL_LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    _get_log_file().write(line + "\n")
+
+# ================== JSON ==================
+
+def json_loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # ================== HELPERS ==================
 
-def time_to_hour(hhmm: str) -> float:
-    h, m = map(int, hhmm.split(":"))
+def time_to_hour(h: int, m: int) -> float:
     return h + m / 60.0
 
 
+def parse_ddmmyyyy(s: str) -> date:
+    # рядок "дд.мм.рррр" формуємо самі в extract_date_from_post,
+    # тому strptime з його розбором формату тут не потрібен
+    d, m, y = s.split(".")
+    return date(int(y), int(m), int(d))
+
+
+
 
 
+# Предикати приймають текст, уже переведений у нижній регістр,
+# щоб пост lower()-ився один раз, а не в кожній перевірці
 
-def is_schedule_post(text: str) -> bool:
-    return any(k.lower() in text.lower() for k in KEYWORDS)
+def is_schedule_post(text_lc: str) -> bool:
+    return any(k in text_lc for k in KEYWORDS_LC)
 
 
-def is_update_post(text: str) -> bool:
-    return any(k in text.lower() for k in [
-        "оновлений графік",
-        "оновлено графік",
-        "скорегований графік"
-    ])
+def is_update_post(text_lc: str) -> bool:
+    return any(k in text_lc for k in UPDATE_KEYWORDS)
 
 
 def log_group_intervals(group_id: str, intervals: list[tuple[str, str]]):
@@ -70,44 +147,115 @@ def log_group_intervals(group_id: str, intervals: list[tuple[str, str]]):
 
 # ================== TELEGRAM ==================
 
-async def fetch_posts() -> list:
+# t.me/s/ віддає пости вже відрендереними на сервері, тому за замовчуванням
+# сторінка завантажується звичайним HTTP-запитом. Playwright (--browser)
+# лишається як запасний варіант, якщо Telegram почне вимагати JS.
+
+# Парсимо тільки блоки повідомлень — шапку, меню та підвал сторінки
+# BeautifulSoup при цьому навіть не перетворює на вузли дерева.
+# Під час парсингу class ще не розбитий на список ("tgme_widget_message
+# js-widget_message"), тому шукаємо клас як окреме слово, а не рівність
+MESSAGE_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"(?:^|\s)tgme_widget_message(?:\s|$)")
+)
+
+# Потрібен лише текст постів — картинки, шрифти та відео не завантажуємо.
+# CSS лишаємо: innerText залежить від стилів (приховані елементи, переноси)
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# Для кожного повідомлення — innerText першого .tgme_widget_message_text
+# (те саме, що query_selector + inner_text), або null, якщо тексту немає
+EXTRACT_TEXTS_JS = """
+() => Array.from(
+    document.querySelectorAll(".tgme_widget_message"),
+    msg => {
+        const el = msg.querySelector(".tgme_widget_message_text");
+        return el ? el.innerText : null;
+    }
+)
+"""
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def fetch_html() -> str:
+    response = requests.get(URL, headers=HTTP_HEADERS, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+
+def message_text(el) -> str:
+    # як innerText у браузері: <br> — це перенос рядка,
+    # на ньому тримається розбір груп у parse_schedule_from_text
+    for br in el.find_all("br"):
+        br.replace_with("\n")
+    return el.get_text()
+
+
+async def fetch_texts_http() -> list:
+    html = await asyncio.to_thread(fetch_html)
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=MESSAGE_STRAINER)
+
+    texts = []
+    for msg in soup.select(".tgme_widget_message"):
+        el = msg.select_one(".tgme_widget_message_text")
+        texts.append(message_text(el) if el else None)
+    return texts
+
+
+async def fetch_texts_browser() -> list:
+    from playwright.async_api import async_playwright
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(
             headless=True,
             args=["--no-sandbox", "--disable-dev-shm-usage"]
         )
         page = await browser.new_page()
-        await page.goto(URL, timeout=60000)
+        await page.route("**/*", block_heavy_resources)
+        await page.goto(URL, wait_until="domcontentloaded")
         await page.wait_for_selector(".tgme_widget_message")
-        await page.wait_for_timeout(3000)
 
-        posts = []
-        for msg in await page.query_selector_all(".tgme_widget_message"):
-            text_el = await msg.query_selector(".tgme_widget_message_text")
-            if not text_el:
-                continue
-
-            text = await text_el.inner_text()
-            if is_schedule_post(text):
-                posts.append({"text": text})
+        # усі тексти одним викликом у браузері замість пари запитів на кожен пост
+        texts = await page.evaluate(EXTRACT_TEXTS_JS)
 
         await browser.close()
-        log(f"✔️ Знайдено {len(posts)} постів з графіками")
-        return posts
+        return texts
 
-# ================== ДАТА ==================
 
-def extract_date_from_post(text: str) -> str | None:
-    months = {
-        'січня': '01', 'лютого': '02', 'березня': '03', 'квітня': '04',
-        'травня': '05', 'червня': '06', 'липня': '07', 'серпня': '08',
-        'вересня': '09', 'жовтня': '10', 'листопада': '11', 'грудня': '12'
-    }
+async def fetch_posts(use_browser: bool = False) -> list:
+    if use_browser:
+        texts = await fetch_texts_browser()
+    else:
+        texts = await fetch_texts_http()
+
+    # текст у нижньому регістрі рахуємо тут один раз і зберігаємо в пості —
+    # main() використовує його для дати та is_update_post
+    posts = []
+    for text in texts:
+        if text is None:
+            continue
+        text_lc = text.lower()
+        if is_schedule_post(text_lc):
+            posts.append({"text": text, "text_lc": text_lc})
 
-    for d, m in re.findall(r'(\d{1,2})\s+(%s)' % "|".join(months), text.lower()):
-        return f"{d.zfill(2)}.{months[m]}.{datetime.now(TZ).year}"
+    log(f"✔️ Знайдено {len(posts)} постів з графіками")
+    return posts
 
-    return None
+# ================== ДАТА ==================
+
+def extract_date_from_post(text_lc: str, year: int) -> str | None:
+    # потрібна лише перша дата в пості — search зупиняється на першому збігу
+    m = MONTHS_RE.search(text_lc)
+    if not m:
+        return None
+
+    d, month = m.group(1, 2)
+    return f"{d.zfill(2)}.{MONTHS[month]}.{year}"
 
 # ================== ПАРСИНГ ==================
 
@@ -116,7 +264,12 @@ def put_interval(result: dict, group_id: str, t1: float, t2: float):
     t1 += 1
     t2 += 1
 
-    for hour in range(1, 25):
+    # інтервал зачіпає тільки години h, для яких t1 < h + 1 і t2 > h,
+    # тож решту доби не перебираємо
+    first_hour = max(1, math.floor(t1))
+    last_hour = min(24, math.ceil(t2) - 1)
+
+    for hour in range(first_hour, last_hour + 1):
         h = float(hour)
 
         first = t1 < h + 0.5 and t2 > h
@@ -138,15 +291,13 @@ def put_interval(result: dict, group_id: str, t1: float, t2: float):
 def parse_schedule_from_text(text: str) -> dict:
     result = {}
 
-    if "Години відсутності електропостачання" not in text:
+    if SCHEDULE_HEADER not in text:
         return result
 
-    text = text.split("Години відсутності електропостачання", 1)[1]
+    text = text.split(SCHEDULE_HEADER, 1)[1]
 
     for line in text.splitlines():
-        #m = re.match(r'(\d)\.(\d)\s+(.+)', line.strip())
-        # Змінено, щоб дозволити двокрапку або пробіл після номера групи
-        m = re.match(r'(\d)\.(\d)[:\s]*\s*(.+)', line.strip())
+        m = LINE_RE.match(line.strip())
         if not m:
             continue
 
@@ -159,24 +310,14 @@ def parse_schedule_from_text(text: str) -> dict:
         if group_id not in result:
             result[group_id] = {}
 
-        intervals = re.findall(
-            r'(\d{1,2}:\d{2})\s*[-–—]\s*(\d{1,2}:\d{2})',
-            content
-        )
+        intervals = list(INTERVAL_RE.finditer(content))
 
-        log_group_intervals(group_id, intervals)
+        log_group_intervals(group_id, [iv.group(1, 4) for iv in intervals])
 
-        for t1, t2 in intervals:
-            #t1h = time_to_hour(t1)
-            #t2h = time_to_hour(t2)
-#
-            ## якщо інтервал переходить через північ
-            #if t2h <= t1h:
-            #    t2h += 24
-            #
-            #put_interval(result, group_id, t1h, t2h)
-            t1h = time_to_hour(t1)
-            t2h = time_to_hour(t2)
+        for iv in intervals:
+            h1, m1, h2, m2 = map(int, iv.group(2, 3, 5, 6))
+            t1h = time_to_hour(h1, m1)
+            t2h = time_to_hour(h2, m2)
 
             # якщо кінець = 00:00 і початок > 0 — це кінець доби
             if t2h == 0 and t1h > 0:
@@ -192,19 +333,16 @@ def parse_schedule_from_text(text: str) -> dict:
 
 # ================== NORMALIZE ==================
 
+DEFAULT_HOURS = {str(h): "yes" for h in range(1, 25)}
+
+
 def normalize_schedule(schedule: dict) -> dict:
     """
     Гарантує, що кожна група має години 1..24.
     Якщо години немає — 'yes'.
     """
-    normalized = {}
-    for group_id, hours in schedule.items():
-        full = {}
-        for h in range(1, 25):
-            key = str(h)
-            full[key] = hours.get(key, "yes")
-        normalized[group_id] = full
-    return normalized
+    # ключі DEFAULT_HOURS задають порядок 1..24, значення з hours їх перекривають
+    return {g: {**DEFAULT_HOURS, **hours} for g, hours in schedule.items()}
 
 # ================== MERGE ==================
 
@@ -219,20 +357,26 @@ def merge_schedules(base: dict, update: dict) -> dict:
 
 # ================== MAIN ==================
 
-async def main():
-    posts = await fetch_posts()
+async def main(use_browser: bool = False):
+    posts = await fetch_posts(use_browser)
 
-    today = datetime.now(TZ).date()
+    now = datetime.now(TZ)
+    today = now.date()
     tomorrow = today + timedelta(days=1)
 
     schedules = {}
 
     for post in posts:
-        date_str = extract_date_from_post(post["text"])
+        # дешева перевірка підрядка до regex-пошуку дати
+        if SCHEDULE_HEADER not in post["text"]:
+            continue
+
+        text_lc = post["text_lc"]
+        date_str = extract_date_from_post(text_lc, now.year)
         if not date_str:
             continue
 
-        date_obj = datetime.strptime(date_str, "%d.%m.%Y").date()
+        date_obj = parse_ddmmyyyy(date_str)
         if date_obj not in (today, tomorrow):
             continue
 
@@ -243,7 +387,7 @@ async def main():
         if date_str not in schedules:
             schedules[date_str] = parsed
             log(f"📅 Базовий графік для {date_str}")
-        elif is_update_post(post["text"]):
+        elif is_update_post(text_lc):
             schedules[date_str] = merge_schedules(schedules[date_str], parsed)
             log(f"🔄 Оновлення застосовано для {date_str}")
 
@@ -252,19 +396,23 @@ async def main():
         return False
 
     # -------- формування data --------
+    # дати сортуємо до побудови — fact.data одразу впорядкований за часом
+    dated = sorted(
+        ((parse_ddmmyyyy(d), sch) for d, sch in schedules.items()),
+        key=lambda item: item[0]
+    )
+
     out_data = {}
-    for d, sch in schedules.items():
-        dt = datetime.strptime(d, "%d.%m.%Y").replace(tzinfo=TZ)
+    for day, sch in dated:
+        dt = datetime(day.year, day.month, day.day, tzinfo=TZ)
         out_data[str(int(dt.timestamp()))] = normalize_schedule(sch)
 
-    out_data = dict(sorted(out_data.items(), key=lambda x: int(x[0])))
-
     new_json = {
         "regionId": "Cherkasy",
-        "lastUpdated": datetime.now(ZoneInfo("UTC")).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+        "lastUpdated": now.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
         "fact": {
             "data": out_data,
-            "update": datetime.now(TZ).strftime("%d.%m.%Y %H:%M"),
+            "update": now.strftime("%d.%m.%Y %H:%M"),
             "today": int(datetime(today.year, today.month, today.day, tzinfo=TZ).timestamp())
         }
     }
@@ -272,16 +420,12 @@ async def main():
     # ================== DIFF CHECK ==================
     if os.path.exists(OUTPUT_FILE):
         try:
-            with open(OUTPUT_FILE, "r", encoding="utf-8") as f:
-                old_json = json.load(f)
-
-            if json.dumps(
-                old_json.get("fact", {}).get("data", {}),
-                sort_keys=True
-            ) == json.dumps(
-                new_json.get("fact", {}).get("data", {}),
-                sort_keys=True
-            ):
+            with open(OUTPUT_FILE, "rb") as f:
+                old_json = json_loads(f.read())
+
+            # == для dict/list порівнює вміст без урахування порядку ключів
+            # і зупиняється на першій відмінності — серіалізація не потрібна
+            if old_json.get("fact", {}).get("data") == new_json["fact"]["data"]:
                 log("ℹ️ Дані не змінилися — JSON не оновлюємо")
                 return False
 
@@ -290,17 +434,24 @@ async def main():
 
     # ================== SAVE ==================
     log(f"💾 Записую JSON → {OUTPUT_FILE}")
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(new_json, f, ensure_ascii=False, indent=2)
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(json_dumps_pretty(new_json))
 
     log("✔️ JSON успішно оновлено")
     return True
 
 # ================== ENTRY ==================
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cherkasy Oblenergo Telegram parser")
+    parser.add_argument("--browser", "-b", action="store_true", help="Завантажувати сторінку через Playwright (Chromium)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        result = asyncio.run(main())
+        result = asyncio.run(main(use_browser=args.browser))
         if result:
             log("🎉 Парсинг завершено з оновленням")
         else:
@@ -44,7 +44,7 @@ PREV_STATE_FILE = PREV_STATE_DIR / "previous_state.json"
 
 def log(message):
     """Логування повідомлень з timestamp"""
-    timestamp = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now(TZ).strftime("%Y-%m-%d %H:%M:%S")
     line = f"{timestamp} [gener_im_1_G] {message}"
     print(line)
     try:
@@ -93,6 +93,9 @@ class Config:
     TIMEZONE = "Europe/Kyiv" # Часова зона для відображення дат і часу
     OUTPUT_SCALE = 3 # Масштаб для покращення якості зображення при збереженні
 
+# Об'єкт часової зони створюємо один раз, а не в кожному log() / рендері
+TZ = ZoneInfo(Config.TIMEZONE)
+
 def load_previous_state():
     """Завантажує попередній стан графіків"""
     if PREV_STATE_FILE.exists():
@@ -114,7 +117,7 @@ def save_current_state(data: dict):
         state_to_save = {
             "data": fact.get("data", {}),
             "update": fact.get("update"),
-            "timestamp": datetime.now(ZoneInfo("Europe/Kyiv")).isoformat()
+            "timestamp": datetime.now(TZ).isoformat()
         }
         with open(PREV_STATE_FILE, "w", encoding="utf-8") as f:
             json.dump(state_to_save, f, ensure_ascii=False, indent=2)
@@ -323,7 +326,7 @@ class ImageRenderer:
             draw.rectangle([table_x0, y0, table_x0 + Config.LEFT_COL_W, y0 + Config.CELL_H], 
                           fill=Config.TABLE_BG, outline=Config.GRID_COLOR)
             
-            dt = datetime.fromtimestamp(int(day_key), ZoneInfo(Config.TIMEZONE))
+            dt = datetime.fromtimestamp(int(day_key), TZ)
             date_label = dt.strftime("%d %B")
             bbox = draw.textbbox((0, 0), date_label, font=font_date)
             w = bbox[2] - bbox[0]
@@ -539,7 +542,7 @@ class ImageRenderer:
         fact = self.data.get("fact", {})
         pub_text = (fact.get("update") or 
                    self.data.get("lastUpdated") or 
-                   datetime.now(ZoneInfo(Config.TIMEZONE)).strftime("%d.%m.%Y"))
+                   datetime.now(TZ).strftime("%d.%m.%Y"))
         
         pub_label = f"Опубліковано {pub_text}"
         font_small = self.font_manager.get_font(Config.SMALL_FONT_SIZE)
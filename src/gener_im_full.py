@@ -11,11 +11,11 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from PIL import Image, ImageDraw, ImageFont
 import os
 import sys
 from telegram_notify import send_error, send_photo, send_message
+from config import TIMEZONE
 
 # --- Налаштування шляхів ---
 BASE = Path(__file__).parent.parent.absolute()
@@ -33,7 +33,7 @@ FULL_LOG_FILE = LOG_DIR / "full_log.log"
 PREV_STATE_FILE = PREV_STATE_DIR / "previous_state.json"
 
 def log(message):
-    timestamp = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now(TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
     line = f"{timestamp} [gener_im_full] {message}"
     print(line)
     try:
@@ -96,7 +96,7 @@ def save_current_state(data: dict):
         state_to_save = {
             "data": fact.get("data", {}),
             "update": fact.get("update"),
-            "timestamp": datetime.now(ZoneInfo("Europe/Kyiv")).isoformat()
+            "timestamp": datetime.now(TIMEZONE).isoformat()
         }
         with open(PREV_STATE_FILE, "w", encoding="utf-8") as f:
             json.dump(state_to_save, f, ensure_ascii=False, indent=2)
@@ -198,9 +198,8 @@ def get_dates_to_generate(fact_data: dict) -> list:
         sorted_dates = sorted(available_dates)
     
     # Отримуємо поточну дату (початок доби) в Києві
-    kyiv_tz = ZoneInfo("Europe/Kyiv")
-    now = datetime.now(kyiv_tz)
-    today_start = datetime(now.year, now.month, now.day, tzinfo=kyiv_tz)
+    now = datetime.now(TIMEZONE)
+    today_start = datetime(now.year, now.month, now.day, tzinfo=TIMEZONE)
     today_ts = int(today_start.timestamp())
     tomorrow_ts = today_ts + 86400  # +1 день
     
@@ -208,7 +207,7 @@ def get_dates_to_generate(fact_data: dict) -> list:
     
     for day_key in sorted_dates:
         timestamp = int(day_key)
-        date_obj = datetime.fromtimestamp(timestamp, kyiv_tz)
+        date_obj = datetime.fromtimestamp(timestamp, TIMEZONE)
         date_str = date_obj.strftime("%d.%m.%Y")
         
         # Визначаємо, це сьогодні чи завтра
@@ -240,7 +239,7 @@ def get_dates_to_generate(fact_data: dict) -> list:
         # Якщо не знайшли підходящих дат, беремо останню як today
         day_key = sorted_dates[-1]
         timestamp = int(day_key)
-        date_str = datetime.fromtimestamp(timestamp, kyiv_tz).strftime("%d.%m.%Y")
+        date_str = datetime.fromtimestamp(timestamp, TIMEZONE).strftime("%d.%m.%Y")
         result.append((timestamp, day_key, "gpv-all-today.png", date_str))
         log(f"Використовую останню дату як today: {day_key} ({date_str})")
     
@@ -527,7 +526,7 @@ def render_single_date(data: dict, day_ts: int, day_key: str, output_filename: s
                  better_text, fill=TEXT_COLOR, font=font_legend)
 
     # --- Інформація про публікацію ---
-    pub_text = fact.get("update") or data.get("lastUpdated") or datetime.now(ZoneInfo('Europe/Kyiv')).strftime("%d.%m.%Y")
+    pub_text = fact.get("update") or data.get("lastUpdated") or datetime.now(TIMEZONE).strftime("%d.%m.%Y")
     pub_label = f"Опубліковано {pub_text}"
     bbox_pub = draw.textbbox((0,0), pub_label, font=font_small)
     w_pub = bbox_pub[2] - bbox_pub[0]
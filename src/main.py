@@ -2,7 +2,6 @@ import argparse
 import os
 import asyncio
 import json
-from zoneinfo import ZoneInfo
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +11,7 @@ import gener_im_1_G
 import gener_im_full
 import upload_to_github
 from utils import clean_old_files, clean_log
+from config import TIMEZONE
 import cherkasy_telegram_parser
 
 BASE = Path(__file__).parent.parent.absolute()
@@ -24,7 +24,7 @@ os.makedirs(LOG_DIR, exist_ok=True)
 
 
 def log(message):
-    timestamp = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now(TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
     line = f"{timestamp} [main] {message}"
     print(line)
     with open(FULL_LOG_FILE, "a", encoding="utf-8") as f:
@@ -34,6 +34,7 @@ def log(message):
 def parse_args():
     parser = argparse.ArgumentParser(description="Run Cherkasy Oblenergo parser")
     parser.add_argument("--parse", "-p", action="store_true", help="Запустити парсинг Telegram-каналу")
+    parser.add_argument("--browser", "-b", action="store_true", help="Завантажувати сторінку через Playwright (Chromium) замість HTTP-запиту")
     return parser.parse_args()
 
 
@@ -67,7 +68,7 @@ def main():
     if args.parse:
         log("📱 Запускаю парсинг Telegram-каналу Черкаси ОЕ")
         try:
-            result = asyncio.run(cherkasy_telegram_parser.main())
+            result = asyncio.run(cherkasy_telegram_parser.main(use_browser=args.browser))
             
             if result:
                 log("✔️ Парсинг завершено успішно — JSON оновлено")
@@ -1,9 +1,8 @@
 import requests
 import os
 from datetime import datetime
-from zoneinfo import ZoneInfo
 from dotenv import load_dotenv
-from config import  BASE_DIR, BOT_PREFIX
+from config import  BASE_DIR, BOT_PREFIX, TIMEZONE
 
 # --- Завантажуємо .env ---
 #BASE_DIR = os.path.dirname(os.path.dirname(__file__))  # вихід із /src
@@ -19,8 +18,14 @@ os.makedirs(LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(LOG_DIR, "telegram_notify.log")
 FULL_LOG_FILE = os.path.join(LOG_DIR, "full_log.log")
 
+# --- HTTP ---
+# Одна сесія на весь процес: повторні запити до api.telegram.org
+# використовують уже відкрите TCP/TLS-з'єднання
+REQUEST_TIMEOUT = 30
+session = requests.Session()
+
 def log(message):
-    timestamp = datetime.now(ZoneInfo("Europe/Kyiv")).strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = datetime.now(TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
     line = f"{timestamp} [telegram_notify] {message}"
     print(line)
     #with open(LOG_FILE, "a", encoding="utf-8") as f:
@@ -42,10 +47,11 @@ def send_photo(image_path, caption=None):
     try:
         url = f"https://api.telegram.org/bot{TOKEN}/sendPhoto"
         with open(image_path, "rb") as img:
-            requests.post(
+            session.post(
                 url,
                 data={"chat_id": CHAT_ID, "caption": caption or "", "parse_mode": "HTML"},
-                files={"photo": img}
+                files={"photo": img},
+                timeout=REQUEST_TIMEOUT
             )
         caption = caption.replace("\n", " ")
         log(f"✅ Відправлено фото: {image_path} з підписом: {caption or ''}")
@@ -65,7 +71,7 @@ def send_error(text):
             "text": f"<b>{BOT_PREFIX}</b>\n{text}",
             "parse_mode": "HTML"
         }
-        requests.post(url, data=data)
+        session.post(url, data=data, timeout=REQUEST_TIMEOUT)
         log(f"⚠️ Відправлено помилку: {text}")
 
     except Exception as e:
@@ -101,7 +107,7 @@ def send_message(text, silent=False):
             "parse_mode": "HTML",
             "disable_notification": silent  # Додано параметр для беззвучного режиму
         }
-        requests.post(url, data=data)
+        session.post(url, data=data, timeout=REQUEST_TIMEOUT)
         log(f"Відправлено {'безувучне ' if silent else ''}повідомлення: {text}")
 
     except Exception as e:
@@ -1,11 +1,17 @@
 from datetime import datetime, timedelta
 import os
+import re
 from typing import List
 
 from datetime import datetime, timedelta
 
+# Формат "%Y-%m-%d %H:%M:%S" має фіксовану ширину, тому рядки можна
+# порівнювати лексикографічно без strptime на кожному рядку логу
+_LOG_TS_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", re.ASCII)
+
 def clean_log(log_file_path: str, days: int = 7):
     cutoff_time = datetime.now() - timedelta(days=days)
+    cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
     kept_lines = []
     removed_count = 0
 
@@ -17,13 +23,9 @@ def clean_log(log_file_path: str, days: int = 7):
 
                 is_timestamp = False
 
-                if len(line) >= 19:
-                    try:
-                        ts = datetime.strptime(line[:19], "%Y-%m-%d %H:%M:%S")
-                        is_timestamp = True
-                        keep_block = ts >= cutoff_time
-                    except ValueError:
-                        pass
+                if _LOG_TS_RE.match(line):
+                    is_timestamp = True
+                    keep_block = line[:19] >= cutoff_str
 
                 # ❌ до першого timestamp — усе відкидаємо
                 if not is_timestamp and not kept_lines: